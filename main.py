@@ -1,21 +1,49 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
 import json
-import smtplib
-from email.mime.text import MIMEText
+import re
+import importlib.util
+import os
 import logging
-import webbrowser
-from typing import Optional, Dict, Any
+import threading
+import atexit
+from concurrent.futures import Future, ThreadPoolExecutor
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional, Dict, Any, Tuple, List
 from pathlib import Path # <<< CHANGE 1: Import Path for robust file paths
 
-# Keyring and DNS libraries (optional dependencies)
-import keyring
-import keyring.errors
-try:
+# smtplib pulls in ssl and socket, and the email modules the message builder falls back
+# on (email.policy, email.header, email.charset, email.message) plus email.utils for
+# the To field are sizeable too, so all of them are imported on first use instead of
+# delaying the first paint of the window. The names below are for type hints only.
+if TYPE_CHECKING:
     import dns.resolver
-    import dns.exception
-    DNS_PYTHON_AVAILABLE = True
+    import email.charset
+    import email.policy
+    import smtplib
+    import socket
+    import ssl
+
+# keyring discovers and loads its platform backends on import, and webbrowser probes
+# for installed browsers, so both are imported where they are first used.
+
+# orjson parses and serializes in C; the stdlib json module is the fallback
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
 except ImportError:
+    _json_loads = json.loads
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+# dnspython builds its default resolver on import, so only probe for it here and
+# import it on the first domain check. Probing dns.resolver rather than dns keeps an
+# unrelated top-level 'dns' module from passing for dnspython.
+try:
+    DNS_PYTHON_AVAILABLE = importlib.util.find_spec("dns.resolver") is not None
+except ModuleNotFoundError: # 'dns' exists but isn't a package
     DNS_PYTHON_AVAILABLE = False
 
 # --- Constants & Robust Paths ---
@@ -24,118 +52,579 @@ SCRIPT_DIR = Path(__file__).resolve().parent
 APP_SETTINGS_FILE = SCRIPT_DIR / "app_settings.json"
 LOGO_FILE = SCRIPT_DIR / "logo.gif"
 SERVICE_NAME = "zeemailer" # Unique name for the app in the system keyring
+SMTP_TIMEOUT = 30 # Seconds before a stalled SMTP connection gives up
+DNS_TIMEOUT = 2.0 # Seconds to wait on each nameserver during the recipient domain check
+DNS_LIFETIME = 3.0 # Seconds a single DNS query may take across all nameservers
+DNS_CACHE_SIZE = 256 # Answers kept by the resolver's own TTL-honoring cache
+DNS_MAX_PARALLEL = 8 # Most recipient domains looked up at once
+MESSAGE_END_INDEX = "end-1c" # Text index just before the newline Tk always appends
+MAX_UNFOLDED_HEADER = 980 # Longest header value sent without folding (RFC 5322 caps lines at 998)
+MAX_LINE_OCTETS = 998 # Longest body line SMTP allows unencoded, excluding CRLF (RFC 5321/5322)
+MAX_RECENT_DOMAINS = 32 # Recipient domains remembered for DNS prewarming
+PREWARM_DELAY_MS = 1500 # Delay after startup before recent domains are looked up
+
+# --- UI Text ---
+APP_VERSION = "1.1.0"
+PROJECT_URL = "https://github.com/alexantSWE/zeemail"
+ABOUT_TEXT = (
+    f"ZeeMail v{APP_VERSION}\n\n"
+    "A simple email sender built with Python and Tkinter.\n"
+    "by Alireza Rezaei (@alexantSWE)\n\n"
+    "The project's GitHub page has been opened for you."
+)
+DNS_MISSING_NOTE = "(dnspython library not installed)"
 
 # --- Basic Logging Configuration ---
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger("zeemail")
 
 # -------------------------------------------------------------------------
 # 1. DATA AND LOGIC CLASSES (No changes needed here, they use the passed paths)
 # -------------------------------------------------------------------------
 
+# local-part@domain, where the domain is 1-63 character labels that don't start or end
+# with a hyphen, ending in an alphabetic or punycode (xn--, e.g. .xn--p1ai) TLD; group 1
+# is the domain
+_EMAIL_RE = re.compile(
+    r"[^@\s]+@((?:[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\.)+(?:[A-Za-z]{2,}|[Xx][Nn]--[A-Za-z0-9-]{0,58}[A-Za-z0-9]))"
+)
+
+# Any line ending (CRLF, bare CR or bare LF), for normalizing bodies to CRLF
+_LINE_END_RE = re.compile(r"\r\n?|\n")
+
+# Raw icon file contents by path, so another EmailApp in this process skips the disk read
+_ICON_CACHE: Dict[Path, bytes] = {}
+
+def _is_valid_addr(address: str) -> bool:
+    """Syntactic address check shared by every form, run before any DNS or SMTP work."""
+    return _EMAIL_RE.fullmatch(address) is not None
+
+# Immutable defaults copied into every fresh config; see ConfigManager._get_default_config
+_DEFAULT_CONFIG_TEMPLATE: Dict[str, Any] = {
+    "email": "",
+    "app_password": None, # Loaded from keyring
+    "smtp_server": "smtp.gmail.com",
+    "smtp_port": 465,
+    "check_recipient_domain": DNS_PYTHON_AVAILABLE,
+}
+
 class ConfigManager:
     """Manages loading and saving of application configuration."""
     def __init__(self, settings_file: Path, service_name: str): # Type hint updated to Path
         self.settings_file = settings_file
         self.service_name = service_name
         self.config: Dict[str, Any] = self._get_default_config()
+        # Last parsed contents of the settings file and the mtime they were read at
+        self._settings_cache: Optional[Dict[str, Any]] = None
+        self._settings_mtime: Optional[int] = None
+        # Saves and recent-domain updates run on the worker pool; this serializes every
+        # read-modify-write of the settings file, the shared temp file and self.config.
+        self._settings_lock = threading.RLock()
+        # check_recipient_domain as saved, before _enforce_dns_invariant() forces it off
+        self._check_domain_pref: bool = self.config["check_recipient_domain"]
 
     def _get_default_config(self) -> Dict[str, Any]:
-        """Returns the default configuration dictionary."""
-        return {
-            "email": "",
-            "app_password": None, # Loaded from keyring
-            "smtp_server": "smtp.gmail.com",
-            "smtp_port": 465,
-            "check_recipient_domain": DNS_PYTHON_AVAILABLE,
-        }
+        """Returns the default configuration dictionary.
+
+        Every key is always present in self.config, so callers index it directly
+        instead of repeating defaults with dict.get().
+        """
+        config = _DEFAULT_CONFIG_TEMPLATE.copy()
+        config["recent_domains"] = [] # Most recently mailed first; mutable, so not in the template
+        return config
+
+    def _read_settings(self) -> Dict[str, Any]:
+        """Returns the parsed settings file, skipping the re-read while its mtime is unchanged."""
+        mtime = self.settings_file.stat().st_mtime_ns
+        if self._settings_cache is not None and mtime == self._settings_mtime:
+            return self._settings_cache
+        settings = _json_loads(self.settings_file.read_bytes())
+        self._settings_cache, self._settings_mtime = settings, mtime
+        return settings
+
+    def _enforce_dns_invariant(self) -> None:
+        """Keeps check_recipient_domain False without dnspython, so the send path can trust the flag alone.
+
+        Only the in-memory value is forced. The saved preference is kept in
+        _check_domain_pref and written back by save_configuration, so it survives
+        until dnspython is installed.
+        """
+        self._check_domain_pref = self.config["check_recipient_domain"]
+        if not DNS_PYTHON_AVAILABLE:
+            self.config["check_recipient_domain"] = False
 
-    def load_configuration(self) -> None:
-        """Loads settings from file and password from keyring."""
-        self.config = self._get_default_config()
+    def _write_settings(self, prefs: Dict[str, Any]) -> None:
+        """Replaces the settings file with `prefs` atomically, unless it already holds them."""
+        with self._settings_lock:
+            if self._settings_match(prefs):
+                logger.info("Application preferences unchanged; skipping write.")
+                return
+            # Write a sibling temp file and rename it over the original, so a crash
+            # mid-write can never leave a truncated settings file behind.
+            tmp_file = self.settings_file.with_name(self.settings_file.name + ".tmp")
+            data = _json_dumps(prefs)
+            with open(tmp_file, "wb") as f:
+                f.write(data)
+                # Make the new contents durable before the rename makes them visible
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.settings_file)
+            self._settings_cache, self._settings_mtime = prefs, self.settings_file.stat().st_mtime_ns
+            logger.info("Application preferences saved.")
+
+    def _settings_match(self, prefs: Dict[str, Any]) -> bool:
+        """Returns True if the settings file still holds exactly `prefs`, going by the cached parse."""
         try:
-            with open(self.settings_file, "r") as f:
-                settings = json.load(f)
-                self.config.update(settings)
-                # Ensure boolean setting is respected and dependent on dnspython
-                if not DNS_PYTHON_AVAILABLE:
-                    self.config["check_recipient_domain"] = False
-                logging.info(f"Settings loaded from {self.settings_file}")
+            return prefs == self._settings_cache and self.settings_file.stat().st_mtime_ns == self._settings_mtime
         except FileNotFoundError:
-            # This is now an expected, non-error condition on first run
-            logging.info(f"Settings file not found at {self.settings_file}. Using defaults. This is normal on first launch.")
-        except json.JSONDecodeError as e:
-            logging.warning(f"Could not parse settings file '{self.settings_file}': {e}. Using defaults.")
+            return False
+
+    def load_configuration(self) -> None:
+        """Loads settings from file and password from keyring."""
+        with self._settings_lock:
+            self.config = self._get_default_config()
+            if not self.settings_file.exists():
+                # Expected on first run, so it is checked up front rather than handled as an error
+                logger.info("Settings file not found at %s. Using defaults. This is normal on first launch.", self.settings_file)
+            else:
+                try:
+                    settings = self._read_settings()
+                    self.config.update(settings)
+                    logger.info("Settings loaded from %s", self.settings_file)
+                except FileNotFoundError:
+                    # Removed between the existence check and the read
+                    logger.info("Settings file disappeared from %s. Using defaults.", self.settings_file)
+                except json.JSONDecodeError as e: # orjson.JSONDecodeError subclasses this
+                    logger.warning("Could not parse settings file '%s': %s. Using defaults.", self.settings_file, e)
+            recent = self.config["recent_domains"]
+            if not isinstance(recent, list) or not all(isinstance(d, str) for d in recent):
+                # Hand-edited or corrupt; a string would otherwise be prewarmed character by character
+                logger.warning("Ignoring invalid recent_domains in %s.", self.settings_file)
+                self.config["recent_domains"] = []
+            self._enforce_dns_invariant()
 
         # Load password from keyring if an email is configured
-        if self.config.get("email"):
+        if self.config["email"]:
+            import keyring
+            import keyring.errors
             try:
                 password = keyring.get_password(self.service_name, self.config["email"])
                 if password:
                     self.config["app_password"] = password
-                    logging.info(f"Password retrieved from keyring for {self.config['email']}.")
+                    logger.info("Password retrieved from keyring for %s.", self.config['email'])
                 else:
-                    logging.warning(f"No password found in keyring for {self.config['email']}.")
+                    logger.warning("No password found in keyring for %s.", self.config['email'])
             except keyring.errors.NoKeyringError:
-                logging.error("Keyring backend not found. Cannot securely load password.")
+                logger.error("Keyring backend not found. Cannot securely load password.")
                 raise # Re-raise to be handled by the UI
             except Exception as e:
-                logging.error(f"Error retrieving password from keyring: {e}", exc_info=True)
+                logger.error("Error retrieving password from keyring: %s", e, exc_info=True)
                 raise # Re-raise to be handled by the UI
 
     def save_configuration(self, email: str, app_password: str, smtp_server: str, smtp_port: int, check_domain: bool) -> None:
         """Saves non-sensitive settings to file and password to keyring."""
-        prefs_to_save = {
-            "email": email,
-            "smtp_server": smtp_server,
-            "smtp_port": smtp_port,
-            "check_recipient_domain": check_domain,
-        }
-        try:
-            with open(self.settings_file, "w") as f:
-                json.dump(prefs_to_save, f, indent=4)
-            logging.info("Application preferences saved.")
-        except Exception as e:
-            logging.error(f"Could not save app preferences: {e}", exc_info=True)
-            raise IOError(f"Could not save app preferences: {e}")
+        with self._settings_lock:
+            if not DNS_PYTHON_AVAILABLE:
+                # The dialog shows the forced False and can't change it; keep what was saved
+                check_domain = self._check_domain_pref
+            prefs_to_save = {
+                "email": email,
+                "smtp_server": smtp_server,
+                "smtp_port": smtp_port,
+                "check_recipient_domain": check_domain,
+                "recent_domains": self.config["recent_domains"],
+            }
+            try:
+                self._write_settings(prefs_to_save)
+            except Exception as e:
+                logger.error("Could not save app preferences: %s", e)
+                raise IOError(f"Could not save app preferences: {e}")
 
-        try:
-            keyring.set_password(self.service_name, email, app_password)
-            logging.info(f"Password for {email} saved to keyring.")
-        except Exception as e:
-            logging.error(f"Could not save password to keyring: {e}", exc_info=True)
-            raise IOError(f"Could not save password to keyring: {e}")
+            try:
+                if email == self.config["email"] and app_password == self.config["app_password"]:
+                    logger.info("Password for %s unchanged; skipping keyring write.", email)
+                else:
+                    import keyring
+                    keyring.set_password(self.service_name, email, app_password)
+                    logger.info("Password for %s saved to keyring.", email)
+            except Exception as e:
+                logger.error("Could not save password to keyring: %s", e)
+                raise IOError(f"Could not save password to keyring: {e}")
+
+            self.config.update(prefs_to_save)
+            self.config["app_password"] = app_password
+            self._enforce_dns_invariant()
+
+    def remember_domains(self, domains: List[str]) -> None:
+        """Moves `domains` to the front of the persisted recent-domains list.
+
+        Best effort: a failed write is logged, not raised, since the list only feeds
+        DNS prewarming.
+        """
+        # Under the lock, the file read below is the latest save, so the merge can't write
+        # older account settings back over it.
+        with self._settings_lock:
+            recent = list(dict.fromkeys(domains + self.config["recent_domains"]))[:MAX_RECENT_DOMAINS]
+            if recent == self.config["recent_domains"]:
+                return
+            self.config["recent_domains"] = recent
+            try:
+                # Start from the file rather than self.config, which may hold forced values
+                self._write_settings(dict(self._read_settings(), recent_domains=recent))
+            except FileNotFoundError:
+                pass # Nothing saved yet; the list goes out with the first save_configuration
+            except Exception as e:
+                logger.warning("Could not save recent domains: %s", e)
+
+class _DisconnectedBeforeMessage(Exception):
+    """Raised by EmailSender._transmit when the connection drops before any message text is written.
 
-        self.config.update(prefs_to_save)
-        self.config["app_password"] = app_password
+    The original SMTPServerDisconnected is its __cause__.
+    """
 
 class EmailSender:
     """Handles the logic of sending an email."""
-    @staticmethod
-    def check_domain_validity(email_address: str) -> bool:
+    def __init__(self):
+        # A single authenticated connection is kept open and reused across sends,
+        # so only the first email of a session pays for the TLS handshake and login.
+        self._smtp: Optional["smtplib.SMTP_SSL"] = None
+        self._smtp_key: Optional[Tuple[str, int, str, str]] = None
+        # Serializes use of the cached connection between worker threads and close()
+        self._smtp_lock = threading.RLock()
+        atexit.register(self.close)
+        # Loading the CA store is file I/O plus cert parsing; do it once per process
+        self._ssl_context: Optional["ssl.SSLContext"] = None
+
+    # Per-process cache of domain -> (valid, expires_at), ordered by last use
+    _MX_CACHE_SIZE = 256
+    _mx_cache: "OrderedDict[str, Tuple[bool, float]]" = OrderedDict()
+    _mx_lock = threading.Lock() # Checks run on the worker pool
+    _NEGATIVE_TTL = 60 # Seconds to remember a domain that has no mail records
+    # Bounds on a positive result's lifetime: a 0-TTL record shouldn't defeat the cache,
+    # and a day-long one shouldn't hide a domain that has since stopped taking mail.
+    _MIN_TTL, _MAX_TTL = 60, 900
+    _resolver: Optional["dns.resolver.Resolver"] = None
+
+    @classmethod
+    def _cache_domain_result(cls, domain: str, valid: bool, ttl: float) -> None:
+        with cls._mx_lock:
+            cls._mx_cache[domain] = (valid, time.monotonic() + ttl)
+            cls._mx_cache.move_to_end(domain)
+            while len(cls._mx_cache) > cls._MX_CACHE_SIZE:
+                cls._mx_cache.popitem(last=False)
+
+    @classmethod
+    def _get_resolver(cls) -> "dns.resolver.Resolver":
+        """Returns the shared resolver, parsing the system resolver config on first use only."""
+        if cls._resolver is None:
+            import dns.resolver
+            resolver = dns.resolver.Resolver()
+            # Bound how long an unreachable nameserver can hold up a send
+            resolver.timeout, resolver.lifetime = DNS_TIMEOUT, DNS_LIFETIME
+            # Also caches the A/AAAA fallbacks and NoAnswer replies our own cache skips
+            resolver.cache = dns.resolver.LRUCache(DNS_CACHE_SIZE)
+            cls._resolver = resolver
+        return cls._resolver
+
+    @classmethod
+    def _try_resolve(cls, domain: str, rdtype: str) -> Tuple[Optional[bool], int]:
+        """Looks up one record type for a domain.
+
+        Returns (True, ttl) when records exist, (None, 0) when the domain exists but has
+        none of this type, and (False, 0) when it doesn't exist at all. Timeouts propagate,
+        since they say nothing about the domain.
+        """
+        import dns.resolver
+        try:
+            answer = cls._get_resolver().resolve(domain, rdtype)
+            return True, answer.rrset.ttl
+        except dns.resolver.NoAnswer:
+            return None, 0
+        except dns.resolver.NXDOMAIN:
+            return False, 0
+
+    @classmethod
+    def check_domain_validity(cls, email_address: str) -> bool:
         if not DNS_PYTHON_AVAILABLE: return True
+        match = _EMAIL_RE.fullmatch(email_address)
+        if match is None:
+            return False
+        # Normalize so 'User@Gmail.COM' and 'user@gmail.com' share a cache slot
+        domain = match.group(1).lower()
+        with cls._mx_lock:
+            cached = cls._mx_cache.get(domain)
+            if cached is not None:
+                valid, expires_at = cached
+                if time.monotonic() < expires_at:
+                    cls._mx_cache.move_to_end(domain)
+                    return valid
+                del cls._mx_cache[domain]
         try:
-            domain = email_address.split('@')[-1]
-            dns.resolver.resolve(domain, 'MX')
-            logging.info(f"MX records found for domain '{domain}'.")
+            import dns.exception
+            # With no MX record, mail goes to the domain's own address (RFC 5321 implicit MX)
+            for rdtype in ("MX", "A", "AAAA"):
+                found, ttl = cls._try_resolve(domain, rdtype)
+                if found:
+                    logger.info("%s records found for domain '%s'.", rdtype, domain)
+                    cls._cache_domain_result(domain, True, min(max(ttl, cls._MIN_TTL), cls._MAX_TTL))
+                    return True
+                if found is False:
+                    break
+        except ImportError as e:
+            # Listed before the dns.exception clause, which can't be evaluated without the import
+            logger.warning("dnspython could not be imported; skipping the DNS check: %s", e)
             return True
-        except (dns.resolver.NoAnswer, dns.resolver.NXDOMAIN, dns.exception.Timeout, IndexError):
-            logging.warning(f"MX record check failed for domain of '{email_address}'.")
+        except dns.exception.Timeout:
+            # Transient, so not cached
+            logger.warning("DNS check timed out for domain '%s'.", domain)
             return False
         except Exception as e:
-            logging.error(f"An unexpected error occurred during DNS check: {e}")
+            logger.error("An unexpected error occurred during DNS check: %s", e)
             return False
+        logger.warning("DNS check failed for domain of '%s'.", email_address)
+        cls._cache_domain_result(domain, False, cls._NEGATIVE_TTL)
+        return False
+
+    @classmethod
+    def check_domains(cls, email_addresses: List[str]) -> Dict[str, bool]:
+        """Checks every address's domain, looking up each distinct domain once and in parallel."""
+        # One representative address per domain; malformed addresses fail without a lookup
+        by_domain: Dict[str, str] = {}
+        for address in email_addresses:
+            match = _EMAIL_RE.fullmatch(address)
+            if match is not None:
+                by_domain.setdefault(match.group(1).lower(), address)
+        if len(by_domain) <= 1:
+            valid = {domain: cls.check_domain_validity(address) for domain, address in by_domain.items()}
+        else:
+            with ThreadPoolExecutor(max_workers=min(DNS_MAX_PARALLEL, len(by_domain))) as pool:
+                valid = dict(zip(by_domain, pool.map(cls.check_domain_validity, by_domain.values())))
+        results = {}
+        for address in email_addresses:
+            match = _EMAIL_RE.fullmatch(address)
+            results[address] = match is not None and valid[match.group(1).lower()]
+        return results
+
+    def _get_connection(self, sender_cfg: Dict[str, Any]) -> "smtplib.SMTP_SSL":
+        """Returns a live, logged-in connection, reusing the cached one when possible."""
+        import smtplib
+        server, port = sender_cfg["smtp_server"], sender_cfg["smtp_port"]
+        key = (server, port, sender_cfg["email"], sender_cfg["app_password"])
+        if self._smtp is not None and self._smtp_key == key:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            logger.info("Cached SMTP connection is no longer alive. Reconnecting.")
+        self.close()
+        logger.info("Connecting to %s:%s to send email.", server, port)
+        if self._ssl_context is None:
+            import ssl
+            self._ssl_context = ssl.create_default_context()
+        connection = smtplib.SMTP_SSL(server, port, context=self._ssl_context, timeout=SMTP_TIMEOUT)
+        try:
+            connection.login(sender_cfg["email"], sender_cfg["app_password"])
+        except Exception:
+            connection.close()
+            raise
+        self._enable_keepalive(connection.sock)
+        self._smtp, self._smtp_key = connection, key
+        return connection
 
-    def send(self, sender_cfg: Dict[str, Any], to: str, subject: str, body: str):
-        msg = MIMEText(body)
+    @staticmethod
+    def _enable_keepalive(sock: "socket.socket") -> None:
+        """Turns on TCP keepalive so an idle connection dropped by a NAT or firewall is noticed early."""
+        import socket
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            # Probe after 60s idle, every 30s, giving up after 3 misses; not every platform has these
+            for option, value in (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 30), ("TCP_KEEPCNT", 3)):
+                if hasattr(socket, option):
+                    sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+        except OSError as e:
+            logger.warning("Could not enable TCP keepalive on the SMTP connection: %s", e)
+
+    # Built by the first message that needs them instead of per message; left unset at
+    # class creation so the email package stays out of startup.
+    _utf8_charset: Optional["email.charset.Charset"] = None
+    _policy_7bit: Optional["email.policy.EmailPolicy"] = None
+
+    @classmethod
+    def _build_message(cls, sender: str, to: str, subject: str, body: str, allow_8bit: bool = False) -> bytes:
+        """Returns the RFC 5322 bytes of a plain-text email.
+
+        With allow_8bit (the server advertises 8BITMIME), a non-ASCII body is sent as raw
+        UTF-8 instead of being base64-encoded. Bodies with a line over the SMTP limit are
+        always encoded, as quoted-printable if ASCII and base64 otherwise.
+        """
+        addresses = (sender, to)
+        if "\r" not in subject and "\n" not in subject and all(
+            h.isascii() and len(h) <= MAX_UNFOLDED_HEADER and "\r" not in h and "\n" not in h for h in addresses
+        ):
+            # Fast path: the headers are assembled directly, so the email package's
+            # object model and generator are skipped for everything the app can type.
+            if not subject.isascii() or len(subject) > MAX_UNFOLDED_HEADER:
+                from email.header import Header
+                if cls._utf8_charset is None:
+                    import email.charset
+                    cls._utf8_charset = email.charset.Charset("utf-8")
+                subject = Header(subject, cls._utf8_charset, header_name="Subject").encode(linesep="\r\n")
+            # Bytes skip sendmail()'s EOL fixing, so a bare CR or LF has to become CRLF here
+            if "\r" in body:  # Rare for text typed into Tk; skip the regex otherwise
+                body = _LINE_END_RE.sub("\r\n", body)
+            else:
+                body = body.replace("\n", "\r\n")
+            payload = body.encode("utf-8")
+            # Tk wraps long paragraphs only visually, so a typed paragraph is one line
+            short_lines = len(payload) <= MAX_LINE_OCTETS or max(map(len, payload.split(b"\r\n"))) <= MAX_LINE_OCTETS
+            if short_lines and body.isascii():
+                charset, encoding = "us-ascii", "7bit"
+            elif short_lines and allow_8bit:
+                charset, encoding = "utf-8", "8bit"
+            elif body.isascii():
+                import email.quoprimime
+                payload = email.quoprimime.body_encode(body, eol="\r\n").encode("ascii")
+                charset, encoding = "us-ascii", "quoted-printable"
+            else:
+                import base64
+                payload = base64.encodebytes(payload).replace(b"\n", b"\r\n")
+                charset, encoding = "utf-8", "base64"
+            return (
+                f"From: {sender}\r\nTo: {to}\r\nSubject: {subject}\r\n"
+                f"MIME-Version: 1.0\r\nContent-Type: text/plain; charset=\"{charset}\"\r\n"
+                f"Content-Transfer-Encoding: {encoding}\r\n\r\n"
+            ).encode("ascii") + payload
+        import email.policy
+        from email.message import EmailMessage
+        # Internationalized or very long address lists need real folding, and the
+        # header registry rejects CR/LF in any value (header injection).
+        if cls._policy_7bit is None:
+            cls._policy_7bit = email.policy.SMTP.clone(cte_type="7bit")
+        policy = email.policy.SMTP if allow_8bit else cls._policy_7bit
+        msg = EmailMessage(policy=policy)
         msg['Subject'] = subject
-        msg['From'] = sender_cfg["email"]
+        msg['From'] = sender
         msg['To'] = to
-        server, port = sender_cfg["smtp_server"], sender_cfg["smtp_port"]
-        logging.info(f"Connecting to {server}:{port} to send email.")
-        with smtplib.SMTP_SSL(server, port) as smtp_server:
-            smtp_server.login(sender_cfg["email"], sender_cfg["app_password"])
-            smtp_server.sendmail(sender_cfg["email"], to, msg.as_string())
-        logging.info(f"Email sent successfully to {to}.")
+        msg.set_content(body)
+        return msg.as_bytes()
+
+    @staticmethod
+    def _transmit(connection: "smtplib.SMTP_SSL", sender: str, recipients: List[str], raw: bytes,
+                  mail_options: List[str]) -> Dict[str, Tuple[int, bytes]]:
+        """Runs one mail transaction with sendmail()'s results and errors, pipelined when possible.
+
+        If the server advertises PIPELINING (RFC 2920), MAIL, every RCPT and DATA go out in
+        a single write and their replies are read back in order, saving a round trip per
+        command. A disconnect before any message text is written raises
+        _DisconnectedBeforeMessage, the only case the caller may safely retry.
+        """
+        import smtplib
+
+        def abort(error: Exception, end_data: bool = False) -> None:
+            try:
+                if end_data:
+                    # DATA was accepted regardless, so the server is reading message text and
+                    # would swallow the RSET; end the message empty first.
+                    connection.send(b".\r\n")
+                    connection.getreply()
+                connection.rset()
+            except smtplib.SMTPException:
+                pass # The caller reconnects on the next send anyway
+            raise error
+
+        options = list(mail_options)
+        if connection.has_extn("size"):
+            options.append(f"SIZE={len(raw)}")
+        pipelining = connection.has_extn("pipelining")
+        refused = {}
+        try:
+            if pipelining:
+                commands = [f"MAIL FROM:{smtplib.quoteaddr(sender)}" + "".join(" " + o for o in options)]
+                commands += [f"RCPT TO:{smtplib.quoteaddr(rcpt)}" for rcpt in recipients]
+                commands.append("DATA")
+                connection.send("".join(c + "\r\n" for c in commands))
+                mail_code, mail_reply = connection.getreply()
+                for rcpt in recipients:
+                    code, reply = connection.getreply()
+                    if code not in (250, 251):
+                        refused[rcpt] = (code, reply)
+                data_code, data_reply = connection.getreply()
+            else:
+                mail_code, mail_reply = connection.mail(sender, options)
+                if mail_code == 250:
+                    for rcpt in recipients:
+                        code, reply = connection.rcpt(rcpt)
+                        if code not in (250, 251):
+                            refused[rcpt] = (code, reply)
+        except smtplib.SMTPServerDisconnected as e:
+            raise _DisconnectedBeforeMessage() from e
+
+        # RFC 2920: every reply in the group is checked, DATA's included, before giving up
+        if mail_code != 250:
+            abort(smtplib.SMTPSenderRefused(mail_code, mail_reply, sender), pipelining and data_code == 354)
+        if len(refused) == len(recipients):
+            abort(smtplib.SMTPRecipientsRefused(refused), pipelining and data_code == 354)
+        # From here on the server may already hold the message, so a disconnect propagates
+        # as-is and is reported instead of retried (it could deliver the message twice).
+        if not pipelining:
+            try:
+                code, reply = connection.data(raw)
+            except smtplib.SMTPDataError as e:
+                abort(e)
+        else:
+            if data_code != 354:
+                abort(smtplib.SMTPDataError(data_code, data_reply))
+            # Dot-stuff lines starting with '.', then terminate, as SMTP.data() does
+            payload = re.sub(rb"(?m)^\.", b"..", raw)
+            if not payload.endswith(b"\r\n"):
+                payload += b"\r\n"
+            connection.send(payload + b".\r\n")
+            code, reply = connection.getreply()
+        if code != 250:
+            abort(smtplib.SMTPDataError(code, reply))
+        return refused
+
+    def send(self, sender_cfg: Dict[str, Any], recipients: List[str], subject: str, body: str) -> Dict[str, str]:
+        """Sends one message to all recipients in a single transaction; returns the ones the server refused."""
+        import smtplib
+        sender = sender_cfg["email"]
+        with self._smtp_lock:
+            connection = self._get_connection(sender_cfg)
+            # One serialization and one DATA phase, with an RCPT TO per recipient
+            raw = self._build_message(sender, ", ".join(recipients), subject, body, connection.has_extn("8bitmime"))
+            mail_options = [] if raw.isascii() else ["BODY=8BITMIME"]
+            try:
+                try:
+                    refused = self._transmit(connection, sender, recipients, raw, mail_options)
+                except _DisconnectedBeforeMessage:
+                    # The server dropped the idle connection between our NOOP and the send, before
+                    # any message text went out, so one retry can't deliver it twice.
+                    logger.info("SMTP server closed the connection. Reconnecting and retrying once.")
+                    self.close()
+                    try:
+                        refused = self._transmit(self._get_connection(sender_cfg), sender, recipients, raw, mail_options)
+                    except _DisconnectedBeforeMessage as e:
+                        raise e.__cause__
+            except smtplib.SMTPRecipientsRefused as e:
+                refused = e.recipients
+        reasons = {rcpt: f"{code} {reply.decode(errors='replace')}" for rcpt, (code, reply) in refused.items()}
+        for rcpt, reason in reasons.items():
+            logger.warning("Server refused recipient %s: %s", rcpt, reason)
+        logger.info("Email sent successfully to %s of %s recipient(s).", len(recipients) - len(reasons), len(recipients))
+        return reasons
+
+    def close(self) -> None:
+        """Closes the cached SMTP connection, if any."""
+        with self._smtp_lock:
+            connection, self._smtp, self._smtp_key = self._smtp, None, None
+        if connection is None:
+            return
+        import smtplib
+        try:
+            connection.quit()
+        except (smtplib.SMTPException, OSError):
+            connection.close()
 
 
 # -------------------------------------------------------------------------
@@ -150,43 +639,55 @@ class EmailApp:
         self.logo_path = logo_path # Store the path
         self.root.title("ZeeMail - An Email Sender")
         self.root.geometry("600x550")
-        self.root.protocol("WM_DELETE_WINDOW", self.root.quit)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
         self.config_manager = ConfigManager(APP_SETTINGS_FILE, SERVICE_NAME)
         self.email_sender = EmailSender()
-        self.app_icon = self._load_icon()
-
-        self.status_var = tk.StringVar(value="Initializing...")
-        self.to_var = tk.StringVar()
-        self.subject_var = tk.StringVar()
+        # Runs the blocking DNS checks and SMTP sends off the Tk thread
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="zeemail")
+        # Decoding the icon is disk I/O; defer it until the window has been drawn.
+        # self.app_icon keeps a strong reference so Tk doesn't lose the image.
+        self.app_icon: Optional[tk.PhotoImage] = None
+        self.root.after_idle(self._load_icon)
+
+        self.status_var = tk.StringVar(value="Loading configuration...")
+        # The config dialog is built on first open and then hidden/reshown
+        self._config_win: Optional[tk.Toplevel] = None
+        self._config_vars: Dict[str, tk.Variable] = {}
 
         self._create_widgets()
-        self._load_initial_config()
+        # Reading settings and the keyring is slow I/O (and may raise an OS auth prompt).
+        # A short timer rather than after_idle: idle callbacks can run in the same pass
+        # as the initial map, before the widgets have painted.
+        self.root.after(50, self._load_initial_config)
 
-    def _load_icon(self) -> Optional[tk.PhotoImage]:
+    def _load_icon(self) -> None:
         """Loads the application icon from the provided path."""
         # <<< CHANGE 4: Use the robust self.logo_path
-        if not self.logo_path.is_file():
-            logging.warning(f"Logo file not found at '{self.logo_path}'.")
-            return None
+        if self.logo_path not in _ICON_CACHE:
+            if not self.logo_path.is_file():
+                logger.warning("Logo file not found at '%s'.", self.logo_path)
+                return
+            _ICON_CACHE[self.logo_path] = self.logo_path.read_bytes()
         try:
-            icon = tk.PhotoImage(file=self.logo_path)
+            icon = tk.PhotoImage(data=_ICON_CACHE[self.logo_path])
             self.root.iconphoto(False, icon)
-            logging.info(f"App icon '{self.logo_path.name}' loaded successfully.")
-            return icon
+            self.app_icon = icon
+            logger.info("App icon '%s' loaded successfully.", self.logo_path.name)
         except tk.TclError:
-            logging.warning(f"Could not load '{self.logo_path.name}'. Ensure it's a valid GIF file.")
-            return None
+            logger.warning("Could not load '%s'. Ensure it's a valid GIF file.", self.logo_path.name)
 
     # ... The rest of the EmailApp class is unchanged ...
     def _load_initial_config(self):
         """Tries to load configuration on startup and updates the status."""
         try:
             self.config_manager.load_configuration()
-            email = self.config_manager.config.get("email")
-            password = self.config_manager.config.get("app_password")
+            email = self.config_manager.config["email"]
+            password = self.config_manager.config["app_password"]
             if email and password:
                 self.status_var.set(f"Ready. Configured for {email}.")
+                if self.config_manager.config["check_recipient_domain"] and self.config_manager.config["recent_domains"]:
+                    self.root.after(PREWARM_DELAY_MS, self._prewarm_domains)
             elif email:
                 self.status_var.set(f"Config for {email} found, but password missing from keyring.")
                 messagebox.showwarning(
@@ -200,6 +701,11 @@ class EmailApp:
             self.status_var.set("Error loading configuration. See logs.")
             messagebox.showerror("Configuration Error", f"An error occurred while loading settings: {e}", parent=self.root)
 
+    def _prewarm_domains(self):
+        """Looks up recently mailed domains in the background, so the first send's check hits the cache."""
+        addresses = [f"postmaster@{domain}" for domain in self.config_manager.config["recent_domains"]]
+        self._executor.submit(self.email_sender.check_domains, addresses)
+
     def _create_widgets(self):
         """Creates and lays out all the widgets in the main window."""
         self.root.columnconfigure(1, weight=1)
@@ -214,7 +720,7 @@ class EmailApp:
         menubar.add_cascade(label="File", menu=file_menu)
         file_menu.add_command(label="Clear Form", command=self._clear_fields)
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
+        file_menu.add_command(label="Exit", command=self._on_close)
         
         # Account Menu
         account_menu = tk.Menu(menubar, tearoff=0)
@@ -234,12 +740,15 @@ class EmailApp:
 
         # Widgets
         ttk.Label(main_frame, text="To:").grid(row=0, column=0, sticky="w", pady=2)
-        to_entry = ttk.Entry(main_frame, textvariable=self.to_var)
-        to_entry.grid(row=0, column=1, sticky="ew", pady=2)
-        to_entry.focus_set()
+        # No textvariable: the fields are read once per send, so a Tcl variable trace
+        # firing on every keystroke would cost more than it saves.
+        self.to_entry = ttk.Entry(main_frame)
+        self.to_entry.grid(row=0, column=1, sticky="ew", pady=2)
+        self.to_entry.focus_set()
 
         ttk.Label(main_frame, text="Subject:").grid(row=1, column=0, sticky="w", pady=2)
-        ttk.Entry(main_frame, textvariable=self.subject_var).grid(row=1, column=1, sticky="ew", pady=2)
+        self.subject_entry = ttk.Entry(main_frame)
+        self.subject_entry.grid(row=1, column=1, sticky="ew", pady=2)
 
         ttk.Label(main_frame, text="Message:").grid(row=2, column=0, sticky="nw", pady=2)
         self.message_text = scrolledtext.ScrolledText(main_frame, wrap=tk.WORD, height=15)
@@ -249,83 +758,173 @@ class EmailApp:
         button_frame = ttk.Frame(main_frame)
         button_frame.grid(row=3, column=1, pady=(10, 0), sticky="e")
         ttk.Button(button_frame, text="Clear", command=self._clear_fields).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="Send Email", command=self._send_email).pack(side=tk.LEFT)
+        self.send_button = ttk.Button(button_frame, text="Send Email", command=self._send_email)
+        self.send_button.pack(side=tk.LEFT)
 
         # Status Bar
         status_bar = ttk.Label(self.root, textvariable=self.status_var, relief=tk.SUNKEN, anchor="w", padding=5)
         status_bar.grid(row=1, column=0, columnspan=2, sticky="ew")
 
+    def _on_close(self):
+        """Stops the worker pool, closes the cached SMTP connection and exits the main loop."""
+        self._executor.shutdown(wait=False)
+        self.email_sender.close()
+        self.root.quit()
+
     def _clear_fields(self):
-        self.to_var.set("")
-        self.subject_var.set("")
+        self.to_entry.delete(0, tk.END)
+        self.subject_entry.delete(0, tk.END)
         self.message_text.delete("1.0", tk.END)
         self.status_var.set("Fields cleared.")
-        logging.info("Input fields cleared by user.")
+        logger.info("Input fields cleared by user.")
 
     def _send_email(self):
-        cfg = self.config_manager.config
-        if not cfg.get("email") or not cfg.get("app_password"):
+        # One snapshot for the checks below and the worker, so a concurrent save can't mix
+        # settings from before and after it into a single send
+        cfg = dict(self.config_manager.config)
+        if not cfg["email"] or not cfg["app_password"]:
             messagebox.showerror("Configuration Error", "Email account is not fully configured.", parent=self.root)
             self.status_var.set("Configuration incomplete. Please use 'Account > Configure'.")
             return
-        to_email, subject, body = self.to_var.get().strip(), self.subject_var.get(), self.message_text.get("1.0", tk.END).strip()
-        if not all([to_email, subject, body]):
+        to_field, subject, body = self.to_entry.get().strip(), self.subject_entry.get(), self.message_text.get("1.0", MESSAGE_END_INDEX).strip()
+        if not all([to_field, subject, body]):
             messagebox.showwarning("Input Error", "To, Subject, and Message fields cannot be empty.", parent=self.root)
             return
-        if cfg.get("check_recipient_domain") and not self.email_sender.check_domain_validity(to_email):
-            if not messagebox.askyesno("Domain Warning", f"The domain for '{to_email}' might not be valid. Send anyway?", parent=self.root):
-                self.status_var.set("Send cancelled due to domain check.")
-                return
-        self.status_var.set(f"Sending to {to_email}...")
-        self.root.update_idletasks()
-        try:
-            self.email_sender.send(cfg, to_email, subject, body)
-            self.status_var.set(f"Email successfully sent to {to_email}!")
-            messagebox.showinfo("Success", f"Email sent to {to_email}!", parent=self.root)
-        except smtplib.SMTPAuthenticationError:
+        import email.utils
+        # Accepts 'Name <addr>' entries and commas inside quoted display names
+        recipients = [addr for _, addr in email.utils.getaddresses([to_field]) if addr]
+        invalid = [addr for addr in recipients if not _is_valid_addr(addr)]
+        if invalid or not recipients:
+            messagebox.showwarning("Input Error", f"Not a valid email address: {', '.join(invalid) or to_field}", parent=self.root)
+            return
+        # DNS and SMTP both block for up to seconds, so they run on the worker pool. Results
+        # come back through root.after(); worker threads never touch Tk widgets themselves.
+        self.send_button.state(["disabled"])
+        job = (cfg, recipients, subject, body)
+        if cfg["check_recipient_domain"]:
+            self.status_var.set("Checking recipient domains...")
+            future = self._executor.submit(self._find_suspect_domains, recipients)
+            future.add_done_callback(lambda f: self.root.after(0, self._on_domains_checked, f, job))
+        else:
+            self._start_send(*job)
+
+    def _find_suspect_domains(self, recipients: List[str]) -> List[str]:
+        """Runs on the worker pool; returns the recipients whose domain failed the DNS check."""
+        valid = self.email_sender.check_domains(recipients)
+        return [addr for addr in recipients if not valid[addr]]
+
+    def _on_domains_checked(self, future: Future, job: Tuple[Dict[str, Any], List[str], str, str]):
+        if future.exception() is not None:
+            self._on_send_error(future.exception())
+            return
+        suspect = future.result()
+        if suspect and not messagebox.askyesno("Domain Warning", f"The domain for '{', '.join(suspect)}' might not be valid. Send anyway?", parent=self.root):
+            self.send_button.state(["!disabled"])
+            self.status_var.set("Send cancelled due to domain check.")
+            return
+        self._start_send(*job)
+
+    def _start_send(self, cfg: Dict[str, Any], recipients: List[str], subject: str, body: str):
+        self.status_var.set(f"Sending to {', '.join(recipients)}...")
+        future = self._executor.submit(self.email_sender.send, cfg, recipients, subject, body)
+        future.add_done_callback(lambda f: self.root.after(0, self._on_send_done, f, recipients))
+
+    def _on_send_done(self, future: Future, recipients: List[str]):
+        if future.exception() is not None:
+            self._on_send_error(future.exception())
+            return
+        refused: Dict[str, str] = future.result()
+        self.send_button.state(["!disabled"])
+        delivered = ", ".join(addr for addr in recipients if addr not in refused)
+        if delivered and self.config_manager.config["check_recipient_domain"]:
+            domains = [_EMAIL_RE.fullmatch(addr).group(1).lower() for addr in recipients if addr not in refused]
+            self._executor.submit(self.config_manager.remember_domains, domains)
+        if not refused:
+            self.status_var.set(f"Email successfully sent to {delivered}!")
+            messagebox.showinfo("Success", f"Email sent to {delivered}!", parent=self.root)
+            return
+        details = "\n".join(f"{addr}: {reason}" for addr, reason in refused.items())
+        if delivered:
+            self.status_var.set(f"Email sent to {delivered}; {len(refused)} recipient(s) refused.")
+            messagebox.showwarning("Partially Sent", f"Email sent to {delivered}.\n\nRefused by the server:\n{details}", parent=self.root)
+        else:
+            self.status_var.set("The server refused every recipient.")
+            messagebox.showerror("Sending Error", f"The server refused every recipient:\n{details}", parent=self.root)
+
+    def _on_send_error(self, error: Exception):
+        import smtplib  # Already loaded by the worker; this is a sys.modules lookup
+        self.send_button.state(["!disabled"])
+        if isinstance(error, smtplib.SMTPAuthenticationError):
             messagebox.showerror("Authentication Error", "SMTP authentication failed. Check your email and App Password.", parent=self.root)
             self.status_var.set("Authentication failed. Please re-configure.")
-        except Exception as e:
-            messagebox.showerror("Sending Error", f"An error occurred: {e}", parent=self.root)
-            self.status_var.set(f"Error: {e}")
-            logging.error(f"Failed to send email: {e}", exc_info=True)
-            
+            return
+        messagebox.showerror("Sending Error", f"An error occurred: {error}", parent=self.root)
+        self.status_var.set(f"Error: {error}")
+        logger.error("Failed to send email: %s", error, exc_info=error)
+
     def _open_config_window(self):
+        """Shows the configuration dialog, creating its widgets only on first use."""
+        if self._config_win is None or not self._config_win.winfo_exists():
+            self._build_config_window()
+        cfg = self.config_manager.config
+        form = self._config_vars
+        form["email"].set(cfg["email"])
+        form["password"].set("")
+        form["server"].set(cfg["smtp_server"])
+        form["port"].set(cfg["smtp_port"])
+        form["check_domain"].set(cfg["check_recipient_domain"])
+        self._config_win.deiconify()
+        self._config_win.lift()
+        self._config_win.grab_set()
+
+    def _hide_config_window(self):
+        """Hides the configuration dialog so the next open can reuse it."""
+        self._config_win.grab_release()
+        self._config_win.withdraw()
+
+    def _build_config_window(self):
         config_win = tk.Toplevel(self.root)
+        config_win.withdraw()
         config_win.title("Configure Account & Settings")
         config_win.transient(self.root)
-        config_win.grab_set()
         config_win.resizable(False, False)
+        config_win.protocol("WM_DELETE_WINDOW", self._hide_config_window)
+        # Everything is laid out with grid while the window is withdrawn, so Tk computes
+        # the geometry once when it is first shown instead of after every pack().
         frame = ttk.Frame(config_win, padding="15")
-        frame.pack(fill="both", expand=True)
-        cfg = self.config_manager.config
-        email_var, password_var = tk.StringVar(value=cfg.get("email", "")), tk.StringVar()
-        server_var, port_var = tk.StringVar(value=cfg.get("smtp_server", "smtp.gmail.com")), tk.IntVar(value=cfg.get("smtp_port", 465))
-        check_domain_var = tk.BooleanVar(value=cfg.get("check_recipient_domain", True))
+        frame.grid(row=0, column=0, sticky="nsew")
+        frame.columnconfigure(0, weight=1)
+        email_var, password_var = tk.StringVar(), tk.StringVar()
+        server_var, port_var = tk.StringVar(), tk.IntVar()
+        check_domain_var = tk.BooleanVar()
+        self._config_vars = {
+            "email": email_var, "password": password_var,
+            "server": server_var, "port": port_var, "check_domain": check_domain_var,
+        }
         cred_frame = ttk.LabelFrame(frame, text="Account Credentials", padding="10")
-        cred_frame.pack(fill="x", expand=True, pady=5)
+        cred_frame.grid(row=0, column=0, sticky="ew", pady=5)
         cred_frame.columnconfigure(1, weight=1)
         ttk.Label(cred_frame, text="Email:").grid(row=0, column=0, sticky="w", pady=3)
         ttk.Entry(cred_frame, textvariable=email_var).grid(row=0, column=1, sticky="ew")
         ttk.Label(cred_frame, text="App Password:").grid(row=1, column=0, sticky="w", pady=3)
         ttk.Entry(cred_frame, textvariable=password_var, show="*").grid(row=1, column=1, sticky="ew")
         smtp_frame = ttk.LabelFrame(frame, text="SMTP Server", padding="10")
-        smtp_frame.pack(fill="x", expand=True, pady=5)
+        smtp_frame.grid(row=1, column=0, sticky="ew", pady=5)
         smtp_frame.columnconfigure(1, weight=1)
         ttk.Label(smtp_frame, text="Server Address:").grid(row=0, column=0, sticky="w", pady=3)
         ttk.Entry(smtp_frame, textvariable=server_var).grid(row=0, column=1, sticky="ew")
         ttk.Label(smtp_frame, text="Port (SSL):").grid(row=1, column=0, sticky="w", pady=3)
         ttk.Entry(smtp_frame, textvariable=port_var, width=10).grid(row=1, column=1, sticky="w")
         other_frame = ttk.LabelFrame(frame, text="Options", padding="10")
-        other_frame.pack(fill="x", expand=True, pady=5)
+        other_frame.grid(row=2, column=0, sticky="ew", pady=5)
         check_button = ttk.Checkbutton(other_frame, text="Check recipient domain validity before sending", variable=check_domain_var)
-        check_button.pack(anchor="w")
+        check_button.grid(row=0, column=0, sticky="w")
         if not DNS_PYTHON_AVAILABLE:
             check_button.config(state=tk.DISABLED)
-            ttk.Label(other_frame, text="(dnspython library not installed)", foreground="grey").pack(anchor="w", padx=20)
+            ttk.Label(other_frame, text=DNS_MISSING_NOTE, foreground="grey").grid(row=1, column=0, sticky="w", padx=20)
         def on_save():
             email, password, server = email_var.get().strip(), password_var.get(), server_var.get().strip()
-            if not email or "@" not in email:
+            if not _is_valid_addr(email):
                 messagebox.showerror("Input Error", "Please enter a valid email.", parent=config_win)
                 return
             if not password:
@@ -333,27 +932,43 @@ class EmailApp:
                 return
             try:
                 port = port_var.get()
-                self.config_manager.save_configuration(email, password, server, port, check_domain_var.get())
-                messagebox.showinfo("Success", "Configuration saved securely.", parent=config_win)
-                self._load_initial_config()
-                config_win.destroy()
-            except Exception as e:
+            except tk.TclError as e:
                 messagebox.showerror("Save Error", f"Failed to save configuration:\n{e}", parent=config_win)
+                return
+            # The keyring write can block (or raise an OS prompt), so it runs on the worker
+            # pool. Save stays disabled until it finishes, which drops repeated clicks.
+            save_button.state(["disabled"])
+            self.status_var.set("Saving configuration...")
+            future = self._executor.submit(self._save_config, email, password, server, port, check_domain_var.get())
+            future.add_done_callback(lambda f: self.root.after(0, on_saved, f, email))
+        def on_saved(future: Future, email: str):
+            save_button.state(["!disabled"])
+            if future.exception() is not None:
+                self.status_var.set("Configuration not saved.")
+                messagebox.showerror("Save Error", f"Failed to save configuration:\n{future.exception()}", parent=config_win)
+                return
+            messagebox.showinfo("Success", "Configuration saved securely.", parent=config_win)
+            # save_configuration already updated the in-memory config; no need to re-read it
+            self.status_var.set(f"Ready. Configured for {email}.")
+            self._hide_config_window()
         btn_frame = ttk.Frame(frame, padding=(0, 10, 0, 0))
-        btn_frame.pack(fill="x", expand=True)
-        ttk.Button(btn_frame, text="Save", command=on_save).pack(side="right")
-        ttk.Button(btn_frame, text="Cancel", command=config_win.destroy).pack(side="right", padx=5)
+        btn_frame.grid(row=3, column=0, sticky="ew")
+        btn_frame.columnconfigure(0, weight=1) # Pushes the buttons to the right
+        ttk.Button(btn_frame, text="Cancel", command=self._hide_config_window).grid(row=0, column=1, padx=5)
+        save_button = ttk.Button(btn_frame, text="Save", command=on_save)
+        save_button.grid(row=0, column=2)
+        config_win.update_idletasks() # One layout pass now, so it maps at its final size
+        self._config_win = config_win
+
+    def _save_config(self, email: str, password: str, server: str, port: int, check_domain: bool):
+        """Runs on the worker pool; saves the settings and drops the session logged in with the old ones."""
+        self.config_manager.save_configuration(email, password, server, port, check_domain)
+        self.email_sender.close()
 
     def _show_about_dialog(self):
-        webbrowser.open_new_tab("https://github.com/alexantSWE/zeemail")
-        messagebox.showinfo(
-            "About ZeeMail",
-            "ZeeMail v1.1.0\n\n"
-            "A simple email sender built with Python and Tkinter.\n"
-            "by Alireza Rezaei (@alexantSWE)\n\n"
-            "The project's GitHub page has been opened for you.",
-            parent=self.root
-        )
+        import webbrowser
+        webbrowser.open_new_tab(PROJECT_URL)
+        messagebox.showinfo("About ZeeMail", ABOUT_TEXT, parent=self.root)
 
 def main():
     """Application entry point."""
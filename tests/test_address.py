@@ -0,0 +1,27 @@
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from main import _EMAIL_RE, _is_valid_addr
+
+
+class AddressTest(unittest.TestCase):
+    def test_accepts_common_addresses(self):
+        for address in ("user@gmail.com", "first.last+tag@mail.x-y.co.uk", "a@b.io"):
+            self.assertTrue(_is_valid_addr(address), address)
+
+    def test_accepts_punycode_tld(self):
+        for address in ("user@example.xn--p1ai", "user@xn--80ak6aa92e.xn--p1ai", "user@EXAMPLE.XN--P1AI"):
+            self.assertTrue(_is_valid_addr(address), address)
+        self.assertEqual(_EMAIL_RE.fullmatch("user@example.xn--p1ai").group(1), "example.xn--p1ai")
+
+    def test_rejects_malformed_domains(self):
+        for address in ("foo@", "@x.com", "a@.com", "a@x..com", "a@-x.com", "a@x-.com", "a@x.c0m",
+                        "a@x.xn--", "a@x.xn--p1ai-", "a b@x.com", "a@1.2.3.4"):
+            self.assertFalse(_is_valid_addr(address), address)
+
+
+if __name__ == "__main__":
+    unittest.main()
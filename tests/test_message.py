@@ -0,0 +1,24 @@
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from main import EmailSender
+
+
+def body_of(raw):
+    return raw.split(b"\r\n\r\n", 1)[1]
+
+
+class BuildMessageTest(unittest.TestCase):
+    def test_normalizes_every_line_ending_to_crlf(self):
+        for body in ("third\rlone", "a\r\nb\nc\rd", "plain\nx"):
+            wire = body_of(EmailSender._build_message("a@x.com", "b@y.com", "Hi", body))
+            self.assertNotIn(b"\r", wire.replace(b"\r\n", b""), repr(body))
+            self.assertNotIn(b"\n", wire.replace(b"\r\n", b""), repr(body))
+        self.assertEqual(body_of(EmailSender._build_message("a@x.com", "b@y.com", "Hi", "third\rlone")), b"third\r\nlone")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+import smtplib
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from main import EmailSender, _DisconnectedBeforeMessage
+
+
+class FakeConnection:
+    """SMTP connection (pipelining unless told otherwise) that replays scripted replies and records what was sent."""
+
+    def __init__(self, replies, pipelining=True):
+        self.replies = list(replies)
+        self.pipelining = pipelining
+        self.sent = []
+        self.rset_calls = 0
+
+    def has_extn(self, name):
+        return self.pipelining and name.lower() == "pipelining"
+
+    def send(self, data):
+        self.sent.append(data.encode("ascii") if isinstance(data, str) else data)
+
+    def getreply(self):
+        if not self.replies:
+            # A real server would leave us waiting here until SMTP_TIMEOUT
+            raise AssertionError("read a reply the server never sends")
+        reply = self.replies.pop(0)
+        if reply is None:
+            # smtplib reports a dropped connection or a read timeout this way
+            raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        return reply
+
+    # The non-pipelined commands, as thin as smtplib's own: one write, one reply
+    def mail(self, sender, options=()):
+        self.send(f"MAIL FROM:<{sender}>\r\n")
+        return self.getreply()
+
+    def rcpt(self, recip, options=()):
+        self.send(f"RCPT TO:<{recip}>\r\n")
+        return self.getreply()
+
+    def data(self, msg):
+        self.send(b"DATA\r\n")
+        code, reply = self.getreply()
+        if code != 354:
+            raise smtplib.SMTPDataError(code, reply)
+        self.send(msg + b".\r\n")
+        return self.getreply()
+
+    def rset(self):
+        self.rset_calls += 1
+        return (250, b"OK")
+
+
+class TransmitTest(unittest.TestCase):
+    def test_pipelined_send(self):
+        conn = FakeConnection([(250, b"OK"), (250, b"OK"), (354, b"Go"), (250, b"Queued")])
+        refused = EmailSender._transmit(conn, "me@x.com", ["a@y.com"], b"Subject: Hi\r\n\r\n.body", [])
+        self.assertEqual(refused, {})
+        self.assertEqual(conn.sent[0], b"MAIL FROM:<me@x.com>\r\nRCPT TO:<a@y.com>\r\nDATA\r\n")
+        self.assertEqual(conn.sent[1], b"Subject: Hi\r\n\r\n..body\r\n.\r\n")
+        self.assertEqual(conn.rset_calls, 0)
+
+    def test_partial_refusal(self):
+        conn = FakeConnection([(250, b"OK"), (550, b"No such user"), (250, b"OK"), (354, b"Go"), (250, b"Queued")])
+        refused = EmailSender._transmit(conn, "me@x.com", ["bad@y.com", "a@y.com"], b"body\r\n", [])
+        self.assertEqual(refused, {"bad@y.com": (550, b"No such user")})
+        self.assertEqual(conn.sent[1], b"body\r\n.\r\n")
+
+    def test_all_refused(self):
+        conn = FakeConnection([(250, b"OK"), (550, b"No such user"), (554, b"No valid recipients")])
+        with self.assertRaises(smtplib.SMTPRecipientsRefused):
+            EmailSender._transmit(conn, "me@x.com", ["bad@y.com"], b"body\r\n", [])
+        self.assertEqual(len(conn.sent), 1)
+        self.assertEqual(conn.rset_calls, 1)
+
+    def test_all_refused_but_data_accepted(self):
+        conn = FakeConnection([(250, b"OK"), (550, b"No such user"), (354, b"Go"), (554, b"No recipients")])
+        with self.assertRaises(smtplib.SMTPRecipientsRefused):
+            EmailSender._transmit(conn, "me@x.com", ["bad@y.com"], b"body\r\n", [])
+        # The open DATA phase is ended empty before the RSET, never with the message
+        self.assertEqual(conn.sent[1:], [b".\r\n"])
+        self.assertEqual(conn.rset_calls, 1)
+
+    def test_sender_refused_but_data_accepted(self):
+        conn = FakeConnection([(553, b"Bad sender"), (503, b"Need MAIL"), (354, b"Go"), (503, b"Need RCPT")])
+        with self.assertRaises(smtplib.SMTPSenderRefused):
+            EmailSender._transmit(conn, "me@x.com", ["a@y.com"], b"body\r\n", [])
+        self.assertEqual(conn.sent[1:], [b".\r\n"])
+        self.assertEqual(conn.rset_calls, 1)
+
+    def test_disconnect_before_message_is_retryable(self):
+        conn = FakeConnection([None])
+        with self.assertRaises(_DisconnectedBeforeMessage):
+            EmailSender._transmit(conn, "me@x.com", ["a@y.com"], b"body\r\n", [])
+
+    def test_disconnect_after_message_propagates(self):
+        conn = FakeConnection([(250, b"OK"), (250, b"OK"), (354, b"Go"), None])
+        with self.assertRaises(smtplib.SMTPServerDisconnected) as caught:
+            EmailSender._transmit(conn, "me@x.com", ["a@y.com"], b"body\r\n", [])
+        self.assertNotIsInstance(caught.exception, _DisconnectedBeforeMessage)
+
+    def test_without_pipelining(self):
+        conn = FakeConnection([(250, b"OK"), (550, b"No such user"), (250, b"OK"), (354, b"Go"), (250, b"Queued")],
+                              pipelining=False)
+        refused = EmailSender._transmit(conn, "me@x.com", ["bad@y.com", "a@y.com"], b"body\r\n", [])
+        self.assertEqual(refused, {"bad@y.com": (550, b"No such user")})
+        self.assertEqual(conn.sent[-1], b"body\r\n.\r\n")
+
+    def test_without_pipelining_disconnect_in_data_propagates(self):
+        conn = FakeConnection([(250, b"OK"), (250, b"OK"), None], pipelining=False)
+        with self.assertRaises(smtplib.SMTPServerDisconnected) as caught:
+            EmailSender._transmit(conn, "me@x.com", ["a@y.com"], b"body\r\n", [])
+        self.assertNotIsInstance(caught.exception, _DisconnectedBeforeMessage)
+
+
+class SendRetryTest(unittest.TestCase):
+    CFG = {"email": "me@x.com", "app_password": "pw", "smtp_server": "smtp.example.com", "smtp_port": 465}
+
+    def send_with(self, *connections):
+        connections = list(connections)
+        sender = EmailSender()
+        sender._get_connection = lambda cfg: connections.pop(0)
+        sender.close = lambda: None
+        return sender.send(self.CFG, ["a@y.com"], "Hi", "body")
+
+    def test_retries_when_dropped_before_message(self):
+        stale = FakeConnection([None])
+        fresh = FakeConnection([(250, b"OK"), (250, b"OK"), (354, b"Go"), (250, b"Queued")])
+        self.assertEqual(self.send_with(stale, fresh), {})
+        self.assertEqual(len(fresh.sent), 2)
+
+    def test_no_retry_once_message_was_sent(self):
+        # e.g. the server took longer than SMTP_TIMEOUT to acknowledge the final '.'
+        slow = FakeConnection([(250, b"OK"), (250, b"OK"), (354, b"Go"), None])
+        unused = FakeConnection([])
+        with self.assertRaises(smtplib.SMTPServerDisconnected):
+            self.send_with(slow, unused)
+        self.assertEqual(unused.sent, [])
+
+
+if __name__ == "__main__":
+    unittest.main()